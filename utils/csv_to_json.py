@@ -1,26 +1,72 @@
 import csv
 import json
+import os
+import shutil
 import sys
+import tempfile
+
+# Large output buffer so per-row writes are flushed in few syscalls
+WRITE_BUFFER_SIZE = 8 * 1024 * 1024
 
 def csv_to_json(csv_file, json_file):
-    data = []
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # Convert empty strings to None for JSON
-            cleaned_row = {k: (v if v else None) for k, v in row.items()}
-            data.append(cleaned_row)
-    
-    output = {'results': data}
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2)
-    
-    print(f"Converted {len(data)} rows from {csv_file} to {json_file}")
+    # Rows are streamed straight to the output so memory stays flat regardless
+    # of file size; the layout matches json.dump(..., indent=2) exactly. They go
+    # to a temp file that replaces json_file only once the whole CSV has parsed,
+    # so a bad row never leaves a truncated output behind.
+    real_out_path = os.path.realpath(json_file)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(real_out_path))
+    count = 0
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as out, \
+                open(csv_file, 'r', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is not None:
+                width = len(header)
+                # Duplicate header names keep their first position but the last
+                # column's value, as DictReader does
+                columns = {name: i for i, name in enumerate(header)}
+                # Pre-encode '      "key": ' once per column
+                keys = [(f'      {json.dumps(name)}: ', i) for name, i in columns.items()]
+                for row in reader:
+                    if not row:
+                        continue
+                    # Pad short rows so missing trailing fields become None
+                    if len(row) < width:
+                        row.extend([''] * (width - len(row)))
+                    # Convert empty strings to None for JSON
+                    fields = [
+                        prefix + (json.dumps(row[i]) if row[i] else 'null') for prefix, i in keys
+                    ]
+                    # Extra fields beyond the header go under a null key, like DictReader's restkey
+                    if len(row) > width:
+                        overflow = json.dumps(row[width:], indent=2).replace('\n', '\n      ')
+                        fields.append(f'      "null": {overflow}')
+                    out.write(',\n    {\n' if count else '{\n  "results": [\n    {\n')
+                    out.write(',\n'.join(fields))
+                    out.write('\n    }')
+                    count += 1
+            out.write('\n  ]\n}' if count else '{\n  "results": []\n}')
+
+        # mkstemp creates files as 0600; keep the existing output's mode or use the umask default
+        if os.path.exists(real_out_path):
+            shutil.copymode(real_out_path, tmp_path)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, real_out_path)
+    except BaseException:
+        # Never leave a half-written or unplaced temp file behind
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    print(f"Converted {count} rows from {csv_file} to {json_file}")
 
 if __name__ == "__main__":
     if len(sys.argv) != 3:
         print("Usage: python csv_to_json.py <input.csv> <output.json>")
         sys.exit(1)
-    
-    csv_to_json(sys.argv[1], sys.argv[2])
 
+    csv_to_json(sys.argv[1], sys.argv[2])
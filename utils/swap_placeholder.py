@@ -1,42 +1,88 @@
 import argparse
-import sys
+import mmap
 import os
+import shutil
+import sys
+import tempfile
 
 def swap_placeholder(target_file, placeholder, source_file, output_file=None):
     """
     Replaces a placeholder in the target_file with the content of source_file.
+
+    Both files are handled as raw bytes, so line endings and encoding pass
+    through unchanged. The output is written to a temp file and moved into
+    place, which gives it a new inode: hard links to the old output are not
+    updated, and it is owned by the user running the script.
     """
     try:
-        # Check if files exist
-        if not os.path.exists(target_file):
-            print(f"Error: Target file '{target_file}' not found.")
-            sys.exit(1)
-        if not os.path.exists(source_file):
-            print(f"Error: Source file '{source_file}' not found.")
+        if not placeholder:
+            print("Error: Placeholder must not be empty.")
             sys.exit(1)
 
-        # Read target file
-        with open(target_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        needle = placeholder.encode('utf-8')
+
+        # Determine output file
+        out_path = output_file if output_file else target_file
 
-        # Read source file
-        with open(source_file, 'r', encoding='utf-8') as f:
-            source_content = f.read()
+        # Open files directly rather than checking existence first
+        try:
+            tf = open(target_file, 'rb')
+        except FileNotFoundError:
+            print(f"Error: Target file '{target_file}' not found.")
+            sys.exit(1)
 
-        # Check if placeholder exists
-        if placeholder not in content:
-            print(f"Warning: Placeholder '{placeholder}' not found in '{target_file}'. No changes made.")
-            return
+        # Resolve symlinks so the replace writes through to the linked file
+        real_out_path = os.path.realpath(out_path)
+        tmp_path = None
+        try:
+            with tf:
+                # Read source file
+                try:
+                    with open(source_file, 'rb') as f:
+                        source_content = f.read()
+                except FileNotFoundError:
+                    print(f"Error: Source file '{source_file}' not found.")
+                    sys.exit(1)
 
-        # Perform replacement
-        new_content = content.replace(placeholder, source_content)
+                # Map the target instead of reading it so large reports are never copied into memory.
+                # An empty file cannot be mapped, and cannot hold the placeholder either.
+                mm = None
+                if os.fstat(tf.fileno()).st_size:
+                    mm = mmap.mmap(tf.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    # Locate the first occurrence once; it doubles as the existence check
+                    idx = mm.find(needle) if mm is not None else -1
+                    if idx == -1:
+                        print(f"Warning: Placeholder '{placeholder}' not found in '{target_file}'. No changes made.")
+                        return
 
-        # Determine output file
-        out_path = output_file if output_file else target_file
+                    # Write to a temp file beside the output; the target may be the output
+                    # and must stay intact while it is mapped
+                    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(real_out_path))
+                    with os.fdopen(fd, 'wb') as f, memoryview(mm) as view:
+                        pos = 0
+                        while idx != -1:
+                            f.writelines((view[pos:idx], source_content))
+                            pos = idx + len(needle)
+                            idx = mm.find(needle, pos)
+                        f.write(view[pos:])
+                finally:
+                    if mm is not None:
+                        mm.close()
 
-        # Write result
-        with open(out_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+            # mkstemp creates files as 0600; keep the existing output's mode or use the umask default
+            if os.path.exists(real_out_path):
+                shutil.copymode(real_out_path, tmp_path)
+            else:
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(tmp_path, 0o666 & ~umask)
+            os.replace(tmp_path, real_out_path)
+        except BaseException:
+            # Never leave a half-written or unplaced temp file behind
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
 
         print(f"Successfully replaced '{placeholder}' with content from '{source_file}' in '{out_path}'.")
 